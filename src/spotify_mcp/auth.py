@@ -4,17 +4,24 @@ import hashlib
 import secrets
 import base64
 import json
+import os
+import tempfile
+import threading
 import webbrowser
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from urllib.parse import urlencode
 import time
 
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
+from .http_session import create_http_session
 from .oauth_server import start_oauth_callback_server
 
+# Plaintext cache header: 10-digit expires_at, refresh-token flag, newline
+_CACHE_HEADER_SIZE = 12
+
 
 class SpotifyAuth:
     """Handles Spotify authentication using PKCE flow."""
@@ -23,7 +30,7 @@ class SpotifyAuth:
         self,
         client_id: str,
         redirect_uri: str,
-        scopes: list[str],
+        scopes: Union[str, list[str]],
         cache_dir: Optional[str] = None,
     ):
         """
@@ -32,12 +39,23 @@ class SpotifyAuth:
         Args:
             client_id: Spotify application client ID
             redirect_uri: OAuth redirect URI (must use 127.0.0.1)
-            scopes: List of Spotify API scopes to request
+            scopes: Spotify API scopes to request, as a list or a
+                space-separated string
             cache_dir: Directory to cache tokens (default: ~/.spotify-mcp)
         """
         self.client_id = client_id
         self.redirect_uri = redirect_uri
         self.scopes = scopes
+        self._scope_str = scopes if isinstance(scopes, str) else ' '.join(scopes)
+
+        # Authorize URL parameters that don't change between auth attempts
+        self._static_auth_qs = urlencode({
+            'client_id': client_id,
+            'response_type': 'code',
+            'redirect_uri': redirect_uri,
+            'code_challenge_method': 'S256',
+            'scope': self._scope_str,
+        })
 
         if cache_dir:
             self.cache_dir = Path(cache_dir)
@@ -46,42 +64,82 @@ class SpotifyAuth:
 
         self.token_cache_path = self.cache_dir / "token-cache.json"
         self._spotify_client: Optional[spotipy.Spotify] = None
+        self._http = create_http_session()
+        self._auth_manager: Optional[SpotifyOAuth] = None
+        self._auth_lock = threading.Lock()
+
+        # In-memory copy of the token cache so warm calls skip disk I/O
+        self._cached_token: Optional[dict] = None
+        self._cached_expires_at = 0
 
-    def _generate_code_verifier(self) -> str:
-        """Generate PKCE code verifier."""
-        code_verifier = base64.urlsafe_b64encode(secrets.token_bytes(32))
-        return code_verifier.decode('utf-8').rstrip('=')
+    def _generate_code_verifier(self) -> bytes:
+        """Generate PKCE code verifier as unpadded base64url bytes."""
+        return base64.urlsafe_b64encode(secrets.token_bytes(32)).rstrip(b'=')
 
-    def _generate_code_challenge(self, verifier: str) -> str:
+    def _generate_code_challenge(self, verifier: bytes) -> str:
         """Generate PKCE code challenge from verifier."""
-        digest = hashlib.sha256(verifier.encode('utf-8')).digest()
-        code_challenge = base64.urlsafe_b64encode(digest)
-        return code_challenge.decode('utf-8').rstrip('=')
+        digest = hashlib.sha256(verifier).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+
+    def _get_auth_manager(self) -> SpotifyOAuth:
+        """Get the OAuth manager used for token exchange and refresh."""
+        if self._auth_manager is None:
+            self._auth_manager = SpotifyOAuth(
+                client_id=self.client_id,
+                redirect_uri=self.redirect_uri,
+                scope=self._scope_str,
+                open_browser=False,
+                requests_session=self._http,
+            )
+        return self._auth_manager
+
+    def _load_token_cache(self, now: float) -> tuple[Optional[dict], bool]:
+        """
+        Load cached tokens from disk.
+
+        The cache file starts with a fixed-width plaintext header holding
+        ``expires_at`` and a refresh-token flag, so a stale cache that cannot
+        be refreshed is rejected without reading or parsing the JSON body.
+
+        Args:
+            now: Current time, as returned by time.time()
 
-    def _load_token_cache(self) -> Optional[dict]:
-        """Load cached tokens from disk."""
+        Returns:
+            Tuple of (cached tokens or None, whether the token needs a refresh)
+        """
         try:
-            if self.token_cache_path.exists():
-                with open(self.token_cache_path, 'r') as f:
-                    cache = json.load(f)
+            with open(self.token_cache_path, 'rb', buffering=0) as f:
+                header = f.read(_CACHE_HEADER_SIZE)
+                if header.startswith(b'{'):
+                    # Cache written before the header was introduced
+                    cache = json.loads(header + f.readall())
+                    expires_at = cache.get('expires_at', 0)
+                    can_refresh = bool(cache.get('refresh_token'))
+                else:
+                    cache = None
+                    expires_at = int(header[:10])
+                    can_refresh = header[10:11] == b'R'
 
                 # Check if token is still valid (with 5 minute buffer)
-                if cache.get('expires_at', 0) > time.time() + 300:
-                    return cache
+                needs_refresh = expires_at <= now + 300
+                if needs_refresh and not can_refresh:
+                    return None, False
 
-                # If we have a refresh token, return cache so we can refresh
-                if cache.get('refresh_token'):
-                    return cache
+                if cache is None:
+                    cache = json.loads(f.readall())
 
-            return None
+            return cache, needs_refresh
         except Exception:
-            return None
+            return None, False
+
+    def _remember_token(self, cache: dict) -> None:
+        """Keep tokens in memory so later calls can skip the disk cache."""
+        self._cached_token = cache
+        self._cached_expires_at = cache.get('expires_at', 0)
 
     def _save_token_cache(self, token_info: dict) -> None:
-        """Save tokens to disk cache."""
+        """Save tokens to memory and disk cache."""
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-
             cache = {
                 'access_token': token_info['access_token'],
                 'token_type': token_info['token_type'],
@@ -90,13 +148,44 @@ class SpotifyAuth:
                 'scope': token_info['scope'],
                 'expires_at': int(time.time()) + token_info['expires_in'],
             }
+            self._remember_token(cache)
 
-            with open(self.token_cache_path, 'w') as f:
-                json.dump(cache, f, indent=2)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            refresh_flag = 'R' if cache['refresh_token'] else '-'
+
+            # Write to a temp file and swap it in, so a crash mid-write never
+            # leaves a corrupt cache that would force a full re-auth
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix='.token-cache-')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(f"{cache['expires_at']:010d}{refresh_flag}\n")
+                    json.dump(cache, f)
+                os.replace(tmp_path, self.token_cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
 
         except Exception as e:
             print(f"Failed to save token cache: {e}", flush=True)
 
+    def _use_access_token(self, access_token: str) -> spotipy.Spotify:
+        """
+        Point the Spotify client at a new access token.
+
+        The client is built once and its token swapped on refresh. A
+        replaced client would close the shared HTTP session when it is
+        garbage-collected (Spotify.__del__), dropping every pooled
+        connection.
+        """
+        if self._spotify_client is None:
+            self._spotify_client = spotipy.Spotify(
+                auth=access_token,
+                requests_session=self._http,
+            )
+        else:
+            self._spotify_client.set_auth(access_token)
+        return self._spotify_client
+
     def authenticate(self) -> spotipy.Spotify:
         """
         Authenticate with Spotify using PKCE flow.
@@ -107,25 +196,33 @@ class SpotifyAuth:
         Raises:
             Exception: If authentication fails
         """
-        if self._spotify_client:
+        if self._spotify_client and self._cached_expires_at > time.time() + 300:
             return self._spotify_client
 
-        # Try to load cached tokens
-        cached_tokens = self._load_token_cache()
+        # Tool calls run in worker threads; only one may refresh tokens or
+        # run the browser flow at a time
+        with self._auth_lock:
+            return self._authenticate()
+
+    def _authenticate(self) -> spotipy.Spotify:
+        """Refresh or obtain tokens. Caller must hold the auth lock."""
+        now = time.time()
+        if self._spotify_client and self._cached_expires_at > now + 300:
+            # Another thread finished authenticating while we waited
+            return self._spotify_client
+
+        # Only fall back to the disk cache when the memory layer is cold
+        if self._cached_token:
+            cached_tokens = self._cached_token
+            needs_refresh = self._cached_expires_at <= now + 300
+        else:
+            cached_tokens, needs_refresh = self._load_token_cache(now)
 
         if cached_tokens:
-            # Check if token needs refresh
-            if cached_tokens['expires_at'] <= time.time() + 300:
+            if needs_refresh:
                 print("Access token expired, refreshing...", flush=True)
                 try:
-                    auth_manager = SpotifyOAuth(
-                        client_id=self.client_id,
-                        redirect_uri=self.redirect_uri,
-                        scope=' '.join(self.scopes),
-                        open_browser=False,
-                    )
-
-                    new_tokens = auth_manager.refresh_access_token(
+                    new_tokens = self._get_auth_manager().refresh_access_token(
                         cached_tokens['refresh_token']
                     )
 
@@ -134,10 +231,7 @@ class SpotifyAuth:
                         new_tokens['refresh_token'] = cached_tokens['refresh_token']
 
                     self._save_token_cache(new_tokens)
-                    self._spotify_client = spotipy.Spotify(
-                        auth=new_tokens['access_token']
-                    )
-                    return self._spotify_client
+                    return self._use_access_token(new_tokens['access_token'])
 
                 except Exception as e:
                     print(f"Failed to refresh token, starting new auth flow: {e}",
@@ -145,10 +239,8 @@ class SpotifyAuth:
                     # Continue to full auth flow below
             else:
                 print("Using cached access token", flush=True)
-                self._spotify_client = spotipy.Spotify(
-                    auth=cached_tokens['access_token']
-                )
-                return self._spotify_client
+                self._remember_token(cached_tokens)
+                return self._use_access_token(cached_tokens['access_token'])
 
         # Start full PKCE auth flow
         print("Starting Spotify authentication...", flush=True)
@@ -157,17 +249,11 @@ class SpotifyAuth:
         code_challenge = self._generate_code_challenge(code_verifier)
         state = secrets.token_hex(16)
 
-        auth_params = {
-            'client_id': self.client_id,
-            'response_type': 'code',
-            'redirect_uri': self.redirect_uri,
-            'code_challenge_method': 'S256',
-            'code_challenge': code_challenge,
-            'state': state,
-            'scope': ' '.join(self.scopes),
-        }
-
-        auth_url = f"https://accounts.spotify.com/authorize?{urlencode(auth_params)}"
+        # code_challenge and state are URL-safe, so they need no quoting
+        auth_url = (
+            f"https://accounts.spotify.com/authorize?{self._static_auth_qs}"
+            f"&code_challenge={code_challenge}&state={state}"
+        )
 
         print("Opening browser for authentication...", flush=True)
         print(f"If the browser doesn't open, visit: {auth_url}", flush=True)
@@ -180,24 +266,21 @@ class SpotifyAuth:
             raise Exception("State mismatch - possible CSRF attack")
 
         # Exchange code for tokens using SpotifyOAuth
-        auth_manager = SpotifyOAuth(
-            client_id=self.client_id,
-            redirect_uri=self.redirect_uri,
-            scope=' '.join(self.scopes),
-            open_browser=False,
-        )
-
-        # Manually construct the token request with PKCE
-        token_info = auth_manager._request_access_token(
+        # (manually constructing the token request with PKCE)
+        token_info = self._get_auth_manager()._request_access_token(
             callback_result.code,
-            code_verifier
+            code_verifier.decode('ascii')
         )
 
         self._save_token_cache(token_info)
 
         print("Authentication successful!", flush=True)
-        self._spotify_client = spotipy.Spotify(auth=token_info['access_token'])
-        return self._spotify_client
+        return self._use_access_token(token_info['access_token'])
+
+    @property
+    def expires_at(self) -> int:
+        """Expiry time of the current access token, in epoch seconds."""
+        return self._cached_expires_at
 
     def get_client(self) -> spotipy.Spotify:
         """
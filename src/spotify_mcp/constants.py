@@ -0,0 +1,8 @@
+"""Settings shared by the server and the HTTP session.
+
+Kept free of imports so the server can read them without loading the
+HTTP stack.
+"""
+
+# Upper bound on Spotify API requests in flight at once
+MAX_CONCURRENT_REQUESTS = 20
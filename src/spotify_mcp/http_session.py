@@ -0,0 +1,95 @@
+"""Shared HTTP session for Spotify API requests."""
+
+import threading
+
+import requests
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from .constants import MAX_CONCURRENT_REQUESTS
+
+# Total size of response bodies kept for ETag revalidation
+ETAG_CACHE_BYTES = 8 * 1024 * 1024
+
+
+class ETagAdapter(HTTPAdapter):
+    """HTTP adapter that revalidates repeated GET requests with ETags."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # URL -> (ETag, response body, response headers), bounded by total
+        # body size
+        self._etags = LRUCache(
+            maxsize=ETAG_CACHE_BYTES, getsizeof=lambda entry: len(entry[1])
+        )
+        self._etags_lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        """Send a request, answering 304 Not Modified from the stored body."""
+        if request.method != 'GET':
+            return super().send(request, **kwargs)
+
+        with self._etags_lock:
+            cached = self._etags.get(request.url)
+        if cached is not None:
+            request.headers['If-None-Match'] = cached[0]
+
+        response = super().send(request, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            # Read the (empty) 304 body so the connection goes back to the pool
+            response.content
+            # Callers see the stored 200 response; a 304 carries no body
+            response.status_code = 200
+            response.reason = 'OK'
+            response.headers = CaseInsensitiveDict(cached[2])
+            response._content = cached[1]
+        elif response.status_code == 200 and response.headers.get('ETag'):
+            entry = (
+                response.headers['ETag'],
+                response.content,
+                dict(response.headers),
+            )
+            with self._etags_lock:
+                try:
+                    self._etags[request.url] = entry
+                except ValueError:
+                    # Body larger than the whole cache
+                    pass
+
+        return response
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a long-lived HTTP session for Spotipy clients.
+
+    Reusing one session keeps the TLS connection to the Spotify API alive
+    across tool calls. Spotipy only installs its retry policy on sessions it
+    builds itself, so the same policy is mounted here; it backs off on 429
+    responses and honours Retry-After. GET responses that carry an ETag are
+    revalidated with If-None-Match on the next request for the same URL.
+
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+
+    retry = Retry(
+        total=3,
+        connect=None,
+        read=False,
+        allowed_methods=frozenset(['GET', 'POST', 'PUT', 'DELETE']),
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    # Tool calls run concurrently in worker threads; keep enough pooled
+    # connections that none of them has to open a fresh TLS connection
+    adapter = ETagAdapter(pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
@@ -3,7 +3,7 @@
 import http.server
 import socketserver
 from typing import Optional
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qsl
 import threading
 
 
@@ -15,76 +15,91 @@ class OAuthCallbackResult:
         self.state = state
 
 
+# Response bodies are encoded once at import instead of on every request
+_ERROR_HTML_PREFIX = b"""
+    <html>
+        <body>
+            <h1>Authentication Failed</h1>
+            <p>Error: """
+_ERROR_HTML_SUFFIX = b"""</p>
+            <p>You can close this window.</p>
+        </body>
+    </html>
+"""
+
+_MISSING_PARAMS_HTML = b"""
+    <html>
+        <body>
+            <h1>Authentication Failed</h1>
+            <p>Missing code or state parameter.</p>
+            <p>You can close this window.</p>
+        </body>
+    </html>
+"""
+
+_SUCCESS_HTML = b"""
+    <html>
+        <body>
+            <h1>Authentication Successful!</h1>
+            <p>You have successfully authenticated with Spotify.</p>
+            <p>You can close this window and return to Claude Desktop.</p>
+            <script>window.close();</script>
+        </body>
+    </html>
+"""
+
+
 class OAuthCallbackHandler(http.server.BaseHTTPRequestHandler):
     """HTTP request handler for OAuth callback."""
 
     result: Optional[OAuthCallbackResult] = None
     error: Optional[str] = None
+    done: threading.Event = threading.Event()
 
     def log_message(self, format, *args):
         """Suppress default logging."""
         pass
 
+    def _send_html(self, status: int, body: bytes) -> None:
+        """Send an HTML response with a known Content-Length."""
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_GET(self):
         """Handle GET request to callback endpoint."""
         parsed_url = urlparse(self.path)
 
         if parsed_url.path == '/callback':
-            query_params = parse_qs(parsed_url.query)
+            query_params = dict(parse_qsl(parsed_url.query))
 
-            error = query_params.get('error', [None])[0]
+            error = query_params.get('error')
             if error:
-                self.send_response(400)
-                self.send_header('Content-Type', 'text/html')
-                self.end_headers()
-                self.wfile.write(f"""
-                    <html>
-                        <body>
-                            <h1>Authentication Failed</h1>
-                            <p>Error: {error}</p>
-                            <p>You can close this window.</p>
-                        </body>
-                    </html>
-                """.encode())
+                self._send_html(
+                    400, _ERROR_HTML_PREFIX + error.encode() + _ERROR_HTML_SUFFIX
+                )
                 OAuthCallbackHandler.error = error
+                OAuthCallbackHandler.done.set()
                 return
 
-            code = query_params.get('code', [None])[0]
-            state = query_params.get('state', [None])[0]
+            code = query_params.get('code')
+            state = query_params.get('state')
 
             if not code or not state:
-                self.send_response(400)
-                self.send_header('Content-Type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"""
-                    <html>
-                        <body>
-                            <h1>Authentication Failed</h1>
-                            <p>Missing code or state parameter.</p>
-                            <p>You can close this window.</p>
-                        </body>
-                    </html>
-                """)
+                self._send_html(400, _MISSING_PARAMS_HTML)
                 OAuthCallbackHandler.error = "Missing code or state"
+                OAuthCallbackHandler.done.set()
                 return
 
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html')
-            self.end_headers()
-            self.wfile.write(b"""
-                <html>
-                    <body>
-                        <h1>Authentication Successful!</h1>
-                        <p>You have successfully authenticated with Spotify.</p>
-                        <p>You can close this window and return to Claude Desktop.</p>
-                        <script>window.close();</script>
-                    </body>
-                </html>
-            """)
+            self._send_html(200, _SUCCESS_HTML)
 
             OAuthCallbackHandler.result = OAuthCallbackResult(code, state)
+            OAuthCallbackHandler.done.set()
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '9')
             self.end_headers()
             self.wfile.write(b'Not found')
 
@@ -104,14 +119,23 @@ def start_oauth_callback_server(port: int = 8888) -> OAuthCallbackResult:
     """
     OAuthCallbackHandler.result = None
     OAuthCallbackHandler.error = None
+    OAuthCallbackHandler.done = threading.Event()
 
     with socketserver.TCPServer(("127.0.0.1", port), OAuthCallbackHandler) as httpd:
         print(f"OAuth callback server listening on http://127.0.0.1:{port}/callback",
               flush=True)
 
-        # Handle requests until we get a result or error
-        while OAuthCallbackHandler.result is None and OAuthCallbackHandler.error is None:
-            httpd.handle_request()
+        # Serve in the background until the callback handler signals
+        # completion. serve_forever checks for shutdown every 0.5 s (its
+        # default); logging in takes far longer, so a shorter interval would
+        # only add wakeups. The cost is up to 0.5 s between the callback and
+        # returning.
+        server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        server_thread.start()
+        try:
+            OAuthCallbackHandler.done.wait()
+        finally:
+            httpd.shutdown()
 
         if OAuthCallbackHandler.error:
             raise Exception(f"OAuth error: {OAuthCallbackHandler.error}")
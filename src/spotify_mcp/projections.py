@@ -0,0 +1,95 @@
+"""Compact projections of Spotify API objects for tool responses.
+
+Full Spotify objects carry fields such as ``available_markets`` (often 180+
+country codes) that dominate payload size and are rarely useful to an MCP
+client. These helpers keep the fields that describe the object.
+"""
+
+from typing import Optional
+
+
+def _refs(items: Optional[list]) -> list[dict]:
+    """Reduce a list of linked objects to their IDs and names."""
+    return [{'id': item['id'], 'name': item['name']} for item in items or []]
+
+
+def project_track(track: Optional[dict]) -> Optional[dict]:
+    """Project a full or simplified track object."""
+    if not track:
+        return None
+    album = track.get('album')
+    return {
+        'id': track['id'],
+        'name': track['name'],
+        'artists': _refs(track.get('artists')),
+        'album': {'id': album['id'], 'name': album['name']} if album else None,
+        'duration_ms': track.get('duration_ms'),
+        'popularity': track.get('popularity'),
+        'explicit': track.get('explicit'),
+        'uri': track.get('uri'),
+    }
+
+
+def project_artist(artist: Optional[dict]) -> Optional[dict]:
+    """Project a full artist object."""
+    if not artist:
+        return None
+    return {
+        'id': artist['id'],
+        'name': artist['name'],
+        'genres': artist.get('genres', []),
+        'popularity': artist.get('popularity'),
+        'followers': (artist.get('followers') or {}).get('total'),
+        'uri': artist.get('uri'),
+    }
+
+
+def project_album(album: Optional[dict]) -> Optional[dict]:
+    """Project a full or simplified album object, including its tracks."""
+    if not album:
+        return None
+    projected = {
+        'id': album['id'],
+        'name': album['name'],
+        'artists': _refs(album.get('artists')),
+        'album_type': album.get('album_type'),
+        'release_date': album.get('release_date'),
+        'total_tracks': album.get('total_tracks'),
+        'uri': album.get('uri'),
+    }
+    if 'tracks' in album:
+        projected['tracks'] = [
+            project_track(track) for track in album['tracks']['items']
+        ]
+    return projected
+
+
+def project_playlist(playlist: Optional[dict]) -> Optional[dict]:
+    """Project a full or simplified playlist object, including its tracks."""
+    if not playlist:
+        return None
+    tracks = playlist.get('tracks') or {}
+    projected = {
+        'id': playlist['id'],
+        'name': playlist['name'],
+        'description': playlist.get('description'),
+        'owner': (playlist.get('owner') or {}).get('display_name'),
+        'public': playlist.get('public'),
+        'total_tracks': tracks.get('total'),
+        'uri': playlist.get('uri'),
+    }
+    if 'items' in tracks:
+        projected['tracks'] = [
+            project_track(item.get('track')) for item in tracks['items']
+        ]
+    return projected
+
+
+def project_page(page: dict, project) -> dict:
+    """Project every item of a paging object, keeping the paging counts."""
+    return {
+        'items': [project(item) for item in page['items'] if item],
+        'total': page.get('total'),
+        'offset': page.get('offset'),
+        'limit': page.get('limit'),
+    }
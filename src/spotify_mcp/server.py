@@ -1,14 +1,93 @@
 #!/usr/bin/env python3
 """Spotify MCP Server - Main server implementation using FastMCP."""
 
-import json
-from typing import Optional
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Literal, Optional
 
+from cachetools import TTLCache
 from mcp.server.fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from mcp.types import TextContent, Tool as MCPTool
+# Bound at import so the hot path skips the module attribute lookup
+from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS, dumps as _dumps
+from pydantic import AfterValidator, BaseModel, Field
 from smithery.decorators import smithery
 
-from .auth import SpotifyAuth
+from .constants import MAX_CONCURRENT_REQUESTS
+from .projections import (
+    project_album,
+    project_artist,
+    project_page,
+    project_playlist,
+    project_track,
+)
+
+if TYPE_CHECKING:
+    # Imported lazily: spotipy takes a noticeable share of startup time
+    from .auth import SpotifyAuth
+
+
+def _dump(obj, pretty: bool = False) -> str:
+    """Serialize a Spotify API response for a tool result."""
+    # Non-str keys are accepted like stdlib json does
+    option = OPT_NON_STR_KEYS | OPT_INDENT_2 if pretty else OPT_NON_STR_KEYS
+    return _dumps(obj, option=option).decode()
+
+
+def _object_count(response: dict) -> int:
+    """Number of catalog objects in a search response, its size in the cache."""
+    return max(1, sum(
+        len(page.get("items") or ())
+        for page in response.values()
+        if isinstance(page, dict)
+    ))
+
+
+# Raw search responses, shared by the search_* tools. Entries are held as
+# Python objects, so the cache is bounded by the number of catalog objects
+# they contain: a full four-type search at limit 50 holds 200.
+LOOKUP_CACHE_OBJECTS = 2000
+_LOOKUP_CACHE: TTLCache = TTLCache(
+    maxsize=LOOKUP_CACHE_OBJECTS, ttl=60, getsizeof=_object_count
+)
+_LOOKUP_LOCK = threading.Lock()
+
+
+def _cached_lookup(client, method: str, *args, **kwargs):
+    """Call a read-only Spotipy method, caching the raw response briefly."""
+    # Keyed on the client itself so different users never share entries
+    key = (client, method, args, tuple(sorted(kwargs.items())))
+    with _LOOKUP_LOCK:
+        result = _LOOKUP_CACHE.get(key)
+    if result is None:
+        result = getattr(client, method)(*args, **kwargs)
+        with _LOOKUP_LOCK:
+            _LOOKUP_CACHE[key] = result
+    return result
+
+
+class SpotifyMCP(FastMCP):
+    """FastMCP server that builds its tool listing once."""
+
+    _tool_listing: Optional[list[MCPTool]] = None
+
+    def add_tool(self, *args, **kwargs) -> None:
+        """Register a tool and invalidate the cached listing."""
+        self._tool_listing = None
+        super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, name: str) -> None:
+        """Remove a tool and invalidate the cached listing."""
+        self._tool_listing = None
+        super().remove_tool(name)
+
+    async def list_tools(self) -> list[MCPTool]:
+        """List all available tools, reusing the listing between requests."""
+        if self._tool_listing is None:
+            self._tool_listing = await super().list_tools()
+        return self._tool_listing
 
 
 class ConfigSchema(BaseModel):
@@ -37,197 +116,689 @@ SCOPES = [
     "user-read-currently-playing",
 ]
 
+# Joined once at import; SpotifyAuth accepts the string form directly
+SCOPES_STR = " ".join(SCOPES)
+
+# Catalog types fetched together by one search request
+SEARCH_TYPES = "track,artist,album,playlist"
+
+# Largest serialized response, in characters, sent to the client. Bigger
+# results (full objects for long playlists, say) are replaced by a short
+# summary.
+MAX_RESPONSE_SIZE = 512 * 1024
+
+# Largest page size the search and user endpoints accept
+MAX_LIMIT = 50
+
+# Argument types for tool signatures. FastMCP compiles each tool's
+# signature into a pydantic model once at registration and validates every
+# call against it, so out-of-range values fail before reaching Spotify.
+# Limits above the API maximum are clamped rather than rejected, and
+# handlers can pass them through as-is.
+Limit = Annotated[int, Field(ge=1), AfterValidator(lambda limit: min(limit, MAX_LIMIT))]
+TimeRange = Literal["short_term", "medium_term", "long_term"]
+
+
+# Seconds each tool's serialized response may be reused. Catalog data
+# changes on the order of days; user-state tools are never cached.
+_RESPONSE_TTLS = {
+    "get_track": 86400,
+    "get_artist": 86400,
+    "get_album": 86400,
+    "get_artist_top_tracks": 3600,
+    "get_tracks": 86400,
+    "get_artists": 86400,
+    "get_albums": 86400,
+    "get_playlist": 300,
+    "search_tracks": 120,
+    "search_artists": 120,
+    "search_albums": 120,
+    "search_playlists": 120,
+}
+
+# Total size, in characters, of the responses each tool's cache may hold
+RESPONSE_CACHE_SIZE = 4 * 1024 * 1024
+
+_RESPONSE_CACHES = {
+    name: TTLCache(
+        maxsize=RESPONSE_CACHE_SIZE, ttl=ttl, getsizeof=lambda result: len(result.text)
+    )
+    for name, ttl in _RESPONSE_TTLS.items()
+}
 
-@smithery.server(config_schema=ConfigSchema)
-def create_server():
-    """Create and return a FastMCP server instance with session config."""
 
-    mcp = FastMCP("Spotify MCP Server")
+def _cache_key(arguments: dict) -> tuple:
+    """Build a hashable, order-independent cache key from tool arguments."""
+    return tuple(sorted(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in arguments.items()
+    ))
+
+
+# Runs the chunks of a batched lookup in parallel, at most 10 at a time
+_BATCH_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix="spotify-batch")
+
+# Limits concurrent tool calls to what the HTTP connection pool can serve
+_API_SLOTS = asyncio.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Tool calls currently running, keyed by tool, client ID and arguments.
+# An identical call made meanwhile awaits the running one instead of
+# issuing its own Spotify requests.
+_INFLIGHT: dict[tuple, asyncio.Task] = {}
+
+
+# Sessions with the same client ID share one authenticator and token cache
+_AUTH_POOL: dict[str, "SpotifyAuth"] = {}
+_AUTH_POOL_LOCK = threading.Lock()
+
+
+def _preload_auth() -> None:
+    """Import the auth module (and spotipy) ahead of the first tool call."""
+    from . import auth  # noqa: F401
+
+
+def _get_auth(client_id: str) -> "SpotifyAuth":
+    """Get the shared SpotifyAuth for a client ID, creating it on first use."""
+    auth = _AUTH_POOL.get(client_id)
+    if auth is None:
+        from .auth import SpotifyAuth
+
+        with _AUTH_POOL_LOCK:
+            auth = _AUTH_POOL.get(client_id)
+            if auth is None:
+                auth = _AUTH_POOL[client_id] = SpotifyAuth(
+                    client_id=client_id,
+                    redirect_uri="http://127.0.0.1:8888/callback",
+                    scopes=SCOPES_STR,
+                )
+    return auth
+
+
+# Client ID -> (authenticated client, time after which it must be re-checked)
+_CLIENTS: dict[str, tuple[Any, float]] = {}
+
+
+def _get_client(client_id: str):
+    """Get the shared Spotify client for a client ID.
+
+    SpotifyAuth is only consulted again once the token is about to expire,
+    so the hot path is one dict lookup and one float comparison.
+    """
+    cached = _CLIENTS.get(client_id)
+    if cached is not None and time.time() < cached[1]:
+        return cached[0]
+
+    auth = _get_auth(client_id)
+    client = auth.authenticate()
+    # Same 5 minute buffer SpotifyAuth applies before refreshing
+    _CLIENTS[client_id] = (client, auth.expires_at - 300)
+    return client
+
+
+def _search_all(client, arguments: dict) -> dict:
+    """Search all catalog types at once, shared by the search_* tools."""
+    # One cached request serves search_tracks/artists/albums/playlists
+    # when an agent looks up the same query across types
+    return _cached_lookup(
+        client,
+        "search",
+        q=arguments["query"],
+        type=SEARCH_TYPES,
+        limit=arguments["limit"],
+    )
+
+
+def _project(arguments: dict, obj, projector):
+    """Return the full Spotify object if requested, else its projection."""
+    return obj if arguments["full"] else projector(obj)
+
+
+# Keys that hold a result's item list, directly or as a paging object,
+# in the order they are looked for
+_ITEM_KEYS = ("items", "tracks", "artists", "albums", "playlists")
+
+
+def _truncated(result, size: int, pretty: bool) -> str:
+    """Summarize a result too large to send, with a hint to narrow it."""
+    summary = {
+        "truncated": True,
+        "size": size,
+        "hint": "Response too large; request fewer results with limit, "
+                "fewer IDs, or full set to false",
+    }
+    if isinstance(result, dict):
+        for key in _ITEM_KEYS:
+            items = result.get(key)
+            if isinstance(items, dict):
+                items = items.get("items")
+            if isinstance(items, list):
+                summary["count"] = len(items)
+                summary["first"] = items[0] if items else None
+                break
+
+    payload = _dump(summary, pretty)
+    if len(payload) > MAX_RESPONSE_SIZE:
+        # A single item can be big enough on its own
+        del summary["first"]
+        payload = _dump(summary, pretty)
+    return payload
 
-    # Initialize auth (will be done per-session via context)
-    def get_spotify_client(ctx: Context):
-        """Get authenticated Spotify client from context."""
-        config = ctx.session_config
 
-        # Create auth instance for this session
-        if not hasattr(ctx, '_spotify_auth'):
-            ctx._spotify_auth = SpotifyAuth(
-                client_id=config.spotify_client_id,
-                redirect_uri="http://127.0.0.1:8888/callback",
-                scopes=SCOPES,
-            )
+def _track_page(page: dict) -> dict:
+    return project_page(page, project_track)
 
-        return ctx._spotify_auth.authenticate()
 
-    @mcp.tool()
-    def search_tracks(query: str, limit: int = 10, ctx: Context = None) -> str:
+def _h_search_tracks(client, arguments: dict):
+    tracks = _search_all(client, arguments)["tracks"]
+    return {"tracks": _project(arguments, tracks, _track_page)}
+
+
+def _h_get_track(client, arguments: dict):
+    return _project(arguments, client.track(arguments["track_id"]), project_track)
+
+
+def _h_search_artists(client, arguments: dict):
+    artists = _search_all(client, arguments)["artists"]
+    return {"artists": _project(
+        arguments, artists, lambda page: project_page(page, project_artist)
+    )}
+
+
+def _h_get_artist(client, arguments: dict):
+    return _project(arguments, client.artist(arguments["artist_id"]), project_artist)
+
+
+def _h_get_artist_top_tracks(client, arguments: dict):
+    results = client.artist_top_tracks(arguments["artist_id"], country=arguments["market"])
+    return _project(
+        arguments,
+        results,
+        lambda r: {"tracks": [project_track(track) for track in r["tracks"]]},
+    )
+
+
+def _h_search_albums(client, arguments: dict):
+    albums = _search_all(client, arguments)["albums"]
+    return {"albums": _project(
+        arguments, albums, lambda page: project_page(page, project_album)
+    )}
+
+
+def _h_get_album(client, arguments: dict):
+    return _project(arguments, client.album(arguments["album_id"]), project_album)
+
+
+def _h_search_playlists(client, arguments: dict):
+    playlists = _search_all(client, arguments)["playlists"]
+    return {"playlists": _project(
+        arguments, playlists, lambda page: project_page(page, project_playlist)
+    )}
+
+
+def _h_get_playlist(client, arguments: dict):
+    return _project(
+        arguments, client.playlist(arguments["playlist_id"]), project_playlist
+    )
+
+
+def _fetch_batched(fetch, ids: list[str], batch_size: int, key: str) -> list:
+    """Fetch objects through a Spotify batch endpoint, chunks in parallel."""
+    chunks = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+    pages = _BATCH_POOL.map(lambda chunk: fetch(chunk)[key], chunks)
+    return [obj for page in pages for obj in page]
+
+
+def _h_get_tracks(client, arguments: dict):
+    tracks = _fetch_batched(client.tracks, arguments["track_ids"], 50, "tracks")
+    return {"tracks": _project(
+        arguments, tracks, lambda items: [project_track(t) for t in items]
+    )}
+
+
+def _h_get_artists(client, arguments: dict):
+    artists = _fetch_batched(client.artists, arguments["artist_ids"], 50, "artists")
+    return {"artists": _project(
+        arguments, artists, lambda items: [project_artist(a) for a in items]
+    )}
+
+
+def _h_get_albums(client, arguments: dict):
+    albums = _fetch_batched(client.albums, arguments["album_ids"], 20, "albums")
+    return {"albums": _project(
+        arguments, albums, lambda items: [project_album(a) for a in items]
+    )}
+
+
+def _h_get_current_user(client, arguments: dict):
+    return client.current_user()
+
+
+def _h_get_user_playlists(client, arguments: dict):
+    playlists = client.current_user_playlists(limit=arguments["limit"])
+    return _project(
+        arguments, playlists, lambda page: project_page(page, project_playlist)
+    )
+
+
+def _h_get_user_top_tracks(client, arguments: dict):
+    tracks = client.current_user_top_tracks(
+        limit=arguments["limit"],
+        time_range=arguments["time_range"]
+    )
+    return _project(arguments, tracks, _track_page)
+
+
+def _h_get_user_top_artists(client, arguments: dict):
+    artists = client.current_user_top_artists(
+        limit=arguments["limit"],
+        time_range=arguments["time_range"]
+    )
+    return _project(
+        arguments, artists, lambda page: project_page(page, project_artist)
+    )
+
+
+def _h_get_recently_played(client, arguments: dict):
+    tracks = client.current_user_recently_played(limit=arguments["limit"])
+    return _project(
+        arguments,
+        tracks,
+        lambda page: project_page(page, lambda item: {
+            "track": project_track(item["track"]),
+            "played_at": item["played_at"],
+        }),
+    )
+
+
+# Tool name -> handler taking (client, arguments) and returning the response
+_HANDLERS: dict[str, Callable[[Any, dict], Any]] = {
+    "search_tracks": _h_search_tracks,
+    "get_track": _h_get_track,
+    "search_artists": _h_search_artists,
+    "get_artist": _h_get_artist,
+    "get_artist_top_tracks": _h_get_artist_top_tracks,
+    "search_albums": _h_search_albums,
+    "get_album": _h_get_album,
+    "search_playlists": _h_search_playlists,
+    "get_playlist": _h_get_playlist,
+    "get_tracks": _h_get_tracks,
+    "get_artists": _h_get_artists,
+    "get_albums": _h_get_albums,
+    "get_current_user": _h_get_current_user,
+    "get_user_playlists": _h_get_user_playlists,
+    "get_user_top_tracks": _h_get_user_top_tracks,
+    "get_user_top_artists": _h_get_user_top_artists,
+    "get_recently_played": _h_get_recently_played,
+}
+
+
+@smithery.server(config_schema=ConfigSchema)
+def create_server():
+    """Create and return a FastMCP server instance with session config."""
+
+    mcp = SpotifyMCP("Spotify MCP Server")
+
+    # Load spotipy in the background so the server can start answering
+    # requests such as tools/list before it finishes importing
+    threading.Thread(target=_preload_auth, name="spotify-preload", daemon=True).start()
+
+    async def call_handler(ctx: Context, name: str, **arguments) -> TextContent:
+        """Run a tool's handler with the Spotify client for this session's config."""
+        handler = _HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+
+        client_id = ctx.session_config.spotify_client_id
+        key = (client_id, _cache_key(arguments))
+        cache = _RESPONSE_CACHES.get(name)
+        if cache is not None:
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        def run() -> str:
+            result = handler(_get_client(client_id), arguments)
+            payload = _dump(result, arguments["pretty"])
+            if len(payload) > MAX_RESPONSE_SIZE:
+                payload = _truncated(result, len(payload), arguments["pretty"])
+            return payload
+
+        async def fetch() -> TextContent:
+            # Spotipy is blocking, so keep it off the event loop, and cap how
+            # many requests hit the Spotify API at once
+            async with _API_SLOTS:
+                payload = await asyncio.to_thread(run)
+
+            # The fields are known to be valid, so skip pydantic validation
+            result = TextContent.model_construct(type="text", text=payload)
+            if cache is not None:
+                cache[key] = result
+            return result
+
+        inflight_key = (name, key)
+        task = _INFLIGHT.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            _INFLIGHT[inflight_key] = task
+            task.add_done_callback(lambda _: _INFLIGHT.pop(inflight_key, None))
+        # Shielded so one caller cancelling doesn't cancel the others
+        return await asyncio.shield(task)
+
+    # Tools return pre-built text content, which FastMCP passes through
+    # as-is. Structured output is disabled so FastMCP doesn't send every
+    # payload a second time as structuredContent.
+    @mcp.tool(structured_output=False)
+    async def search_tracks(
+        query: str,
+        limit: Limit = 10,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Search for tracks on Spotify.
 
         Args:
             query: Search query for tracks
             limit: Maximum number of results to return (default: 10)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        results = client.search(q=query, type="track", limit=min(limit, 50))
-        return json.dumps(results, indent=2)
+        return await call_handler(
+            ctx, "search_tracks", query=query, limit=limit, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_track(track_id: str, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_track(
+        track_id: str,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get detailed information about a specific track by ID.
 
         Args:
             track_id: Spotify track ID
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        track = client.track(track_id)
-        return json.dumps(track, indent=2)
+        return await call_handler(
+            ctx, "get_track", track_id=track_id, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def search_artists(query: str, limit: int = 10, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def search_artists(
+        query: str,
+        limit: Limit = 10,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Search for artists on Spotify.
 
         Args:
             query: Search query for artists
             limit: Maximum number of results to return (default: 10)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        results = client.search(q=query, type="artist", limit=min(limit, 50))
-        return json.dumps(results, indent=2)
+        return await call_handler(
+            ctx, "search_artists", query=query, limit=limit, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_artist(artist_id: str, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_artist(
+        artist_id: str,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get detailed information about a specific artist by ID.
 
         Args:
             artist_id: Spotify artist ID
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        artist = client.artist(artist_id)
-        return json.dumps(artist, indent=2)
+        return await call_handler(
+            ctx, "get_artist", artist_id=artist_id, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_artist_top_tracks(artist_id: str, market: str = "US", ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_artist_top_tracks(
+        artist_id: str,
+        market: str = "US",
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get top tracks for a specific artist.
 
         Args:
             artist_id: Spotify artist ID
             market: ISO 3166-1 alpha-2 country code (default: US)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        tracks = client.artist_top_tracks(artist_id, country=market)
-        return json.dumps(tracks, indent=2)
+        return await call_handler(
+            ctx, "get_artist_top_tracks",
+            artist_id=artist_id, market=market, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def search_albums(query: str, limit: int = 10, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def search_albums(
+        query: str,
+        limit: Limit = 10,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Search for albums on Spotify.
 
         Args:
             query: Search query for albums
             limit: Maximum number of results to return (default: 10)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        results = client.search(q=query, type="album", limit=min(limit, 50))
-        return json.dumps(results, indent=2)
+        return await call_handler(
+            ctx, "search_albums", query=query, limit=limit, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_album(album_id: str, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_album(
+        album_id: str,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get detailed information about a specific album by ID.
 
         Args:
             album_id: Spotify album ID
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        album = client.album(album_id)
-        return json.dumps(album, indent=2)
+        return await call_handler(
+            ctx, "get_album", album_id=album_id, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def search_playlists(query: str, limit: int = 10, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def search_playlists(
+        query: str,
+        limit: Limit = 10,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Search for playlists on Spotify.
 
         Args:
             query: Search query for playlists
             limit: Maximum number of results to return (default: 10)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        results = client.search(q=query, type="playlist", limit=min(limit, 50))
-        return json.dumps(results, indent=2)
+        return await call_handler(
+            ctx, "search_playlists", query=query, limit=limit, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_playlist(playlist_id: str, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_playlist(
+        playlist_id: str,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get detailed information about a specific playlist by ID.
 
         Args:
             playlist_id: Spotify playlist ID
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
+        """
+        return await call_handler(
+            ctx, "get_playlist", playlist_id=playlist_id, full=full, pretty=pretty
+        )
+
+    @mcp.tool(structured_output=False)
+    async def get_tracks(
+        track_ids: list[str],
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
+        """Get detailed information about several tracks by ID.
+
+        Args:
+            track_ids: Spotify track IDs
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
+        """
+        return await call_handler(
+            ctx, "get_tracks", track_ids=track_ids, full=full, pretty=pretty
+        )
+
+    @mcp.tool(structured_output=False)
+    async def get_artists(
+        artist_ids: list[str],
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
+        """Get detailed information about several artists by ID.
+
+        Args:
+            artist_ids: Spotify artist IDs
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
+        """
+        return await call_handler(
+            ctx, "get_artists", artist_ids=artist_ids, full=full, pretty=pretty
+        )
+
+    @mcp.tool(structured_output=False)
+    async def get_albums(
+        album_ids: list[str],
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
+        """Get detailed information about several albums by ID.
+
+        Args:
+            album_ids: Spotify album IDs
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        playlist = client.playlist(playlist_id)
-        return json.dumps(playlist, indent=2)
+        return await call_handler(
+            ctx, "get_albums", album_ids=album_ids, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_current_user(ctx: Context = None) -> str:
-        """Get the current user's profile information."""
-        client = get_spotify_client(ctx)
-        user = client.current_user()
-        return json.dumps(user, indent=2)
+    @mcp.tool(structured_output=False)
+    async def get_current_user(pretty: bool = False, ctx: Context = None) -> TextContent:
+        """Get the current user's profile information.
 
-    @mcp.tool()
-    def get_user_playlists(limit: int = 20, ctx: Context = None) -> str:
+        Args:
+            pretty: Indent the JSON response for readability (default: false)
+        """
+        return await call_handler(ctx, "get_current_user", pretty=pretty)
+
+    @mcp.tool(structured_output=False)
+    async def get_user_playlists(
+        limit: Limit = 20,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get the current user's playlists.
 
         Args:
             limit: Maximum number of results to return (default: 20)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        playlists = client.current_user_playlists(limit=min(limit, 50))
-        return json.dumps(playlists, indent=2)
+        return await call_handler(
+            ctx, "get_user_playlists", limit=limit, full=full, pretty=pretty
+        )
 
-    @mcp.tool()
-    def get_user_top_tracks(
-        limit: int = 20,
-        time_range: str = "medium_term",
+    @mcp.tool(structured_output=False)
+    async def get_user_top_tracks(
+        limit: Limit = 20,
+        time_range: TimeRange = "medium_term",
+        full: bool = False,
+        pretty: bool = False,
         ctx: Context = None
-    ) -> str:
+    ) -> TextContent:
         """Get the current user's top tracks.
 
         Args:
             limit: Maximum number of results to return (default: 20)
             time_range: Time range - short_term (4 weeks), medium_term (6 months), long_term (years)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        tracks = client.current_user_top_tracks(
-            limit=min(limit, 50),
-            time_range=time_range
+        return await call_handler(
+            ctx, "get_user_top_tracks",
+            limit=limit, time_range=time_range, full=full, pretty=pretty
         )
-        return json.dumps(tracks, indent=2)
 
-    @mcp.tool()
-    def get_user_top_artists(
-        limit: int = 20,
-        time_range: str = "medium_term",
+    @mcp.tool(structured_output=False)
+    async def get_user_top_artists(
+        limit: Limit = 20,
+        time_range: TimeRange = "medium_term",
+        full: bool = False,
+        pretty: bool = False,
         ctx: Context = None
-    ) -> str:
+    ) -> TextContent:
         """Get the current user's top artists.
 
         Args:
             limit: Maximum number of results to return (default: 20)
             time_range: Time range - short_term (4 weeks), medium_term (6 months), long_term (years)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        artists = client.current_user_top_artists(
-            limit=min(limit, 50),
-            time_range=time_range
+        return await call_handler(
+            ctx, "get_user_top_artists",
+            limit=limit, time_range=time_range, full=full, pretty=pretty
         )
-        return json.dumps(artists, indent=2)
 
-    @mcp.tool()
-    def get_recently_played(limit: int = 20, ctx: Context = None) -> str:
+    @mcp.tool(structured_output=False)
+    async def get_recently_played(
+        limit: Limit = 20,
+        full: bool = False,
+        pretty: bool = False,
+        ctx: Context = None
+    ) -> TextContent:
         """Get the current user's recently played tracks.
 
         Args:
             limit: Maximum number of results to return (default: 20)
+            full: Return complete Spotify objects instead of a compact summary (default: false)
+            pretty: Indent the JSON response for readability (default: false)
         """
-        client = get_spotify_client(ctx)
-        tracks = client.current_user_recently_played(limit=min(limit, 50))
-        return json.dumps(tracks, indent=2)
+        return await call_handler(
+            ctx, "get_recently_played", limit=limit, full=full, pretty=pretty
+        )
 
     return mcp
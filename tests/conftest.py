@@ -0,0 +1,45 @@
+"""Shared fixtures for the test suite."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+BODY = b'{"id":"1"}'
+ETAG = '"v1"'
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON handler that answers If-None-Match with 304."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        if self.headers.get('If-None-Match') == ETAG:
+            self.send_response(304)
+            self.send_header('ETag', ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('ETag', ETAG)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Local keep-alive server; ``connections`` records client addresses."""
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    httpd.connections = set()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f'http://127.0.0.1:{httpd.server_address[1]}/v1/'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
@@ -0,0 +1,110 @@
+"""Tests for Spotify authentication."""
+
+import gc
+import json
+import time
+
+from spotify_mcp.auth import SpotifyAuth
+
+
+class StubAuthManager:
+    """Stands in for SpotifyOAuth when refreshing tokens."""
+
+    def refresh_access_token(self, refresh_token):
+        return {
+            'access_token': 'refreshed',
+            'token_type': 'Bearer',
+            'expires_in': 3600,
+            'scope': 'user-read-private',
+        }
+
+
+def make_auth(tmp_path) -> SpotifyAuth:
+    return SpotifyAuth(
+        client_id='client',
+        redirect_uri='http://127.0.0.1:8888/callback',
+        scopes=['user-read-private'],
+        cache_dir=str(tmp_path),
+    )
+
+
+def test_refresh_keeps_client_and_connection(tmp_path, http_server):
+    auth = make_auth(tmp_path)
+    auth._auth_manager = StubAuthManager()
+    auth._remember_token({
+        'access_token': 'initial',
+        'refresh_token': 'refresh',
+        'expires_at': int(time.time()) + 3600,
+    })
+
+    client = auth.authenticate()
+    client.prefix = http_server.url
+    client.track('1')
+
+    # Expire the token so the next call refreshes it
+    auth._cached_token['expires_at'] = auth._cached_expires_at = 0
+    refreshed = auth.authenticate()
+    gc.collect()
+    refreshed.track('1')
+
+    assert refreshed is client
+    assert client._auth == 'refreshed'
+    assert len(http_server.connections) == 1
+
+
+def token_info(expires_in=3600, refresh_token='refresh') -> dict:
+    return {
+        'access_token': 'access',
+        'token_type': 'Bearer',
+        'expires_in': expires_in,
+        'refresh_token': refresh_token,
+        'scope': 'user-read-private',
+    }
+
+
+def test_token_cache_round_trip(tmp_path):
+    auth = make_auth(tmp_path)
+    auth._save_token_cache(token_info())
+
+    cache, needs_refresh = make_auth(tmp_path)._load_token_cache(time.time())
+
+    assert cache == auth._cached_token
+    assert needs_refresh is False
+    header = auth.token_cache_path.read_bytes()[:12]
+    assert header == f"{cache['expires_at']:010d}R\n".encode()
+
+
+def test_stale_token_cache_without_refresh_token(tmp_path):
+    auth = make_auth(tmp_path)
+    auth._save_token_cache(token_info(expires_in=0, refresh_token=''))
+
+    assert auth._load_token_cache(time.time()) == (None, False)
+
+
+def test_stale_token_cache_with_refresh_token(tmp_path):
+    auth = make_auth(tmp_path)
+    auth._save_token_cache(token_info(expires_in=0))
+
+    cache, needs_refresh = auth._load_token_cache(time.time())
+
+    assert cache['refresh_token'] == 'refresh'
+    assert needs_refresh is True
+
+
+def test_legacy_json_token_cache(tmp_path):
+    auth = make_auth(tmp_path)
+    legacy = dict(token_info(), expires_at=int(time.time()) + 3600)
+    auth.token_cache_path.write_text(json.dumps(legacy, indent=2))
+
+    assert auth._load_token_cache(time.time()) == (legacy, False)
+
+
+def test_corrupt_token_cache_header(tmp_path):
+    auth = make_auth(tmp_path)
+    auth.token_cache_path.write_bytes(b'not-a-header\n{}')
+
+    assert auth._load_token_cache(time.time()) == (None, False)
+
+
+def test_missing_token_cache(tmp_path):
+    assert make_auth(tmp_path)._load_token_cache(time.time()) == (None, False)
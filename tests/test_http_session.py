@@ -0,0 +1,27 @@
+"""Tests for the shared HTTP session."""
+
+from conftest import BODY
+
+from spotify_mcp.http_session import create_http_session
+
+
+def test_not_modified_returns_stored_response(http_server):
+    session = create_http_session()
+    url = http_server.url + 'tracks/1'
+
+    first = session.get(url)
+    second = session.get(url)
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == BODY
+    assert second.headers['Content-Type'] == 'application/json'
+
+
+def test_not_modified_reuses_connection(http_server):
+    session = create_http_session()
+    url = http_server.url + 'tracks/1'
+
+    for _ in range(5):
+        assert session.get(url).content == BODY
+
+    assert len(http_server.connections) == 1
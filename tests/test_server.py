@@ -0,0 +1,142 @@
+"""Tests for tool dispatch in the MCP server."""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from spotify_mcp import server
+
+
+class StubClient:
+    """Stands in for spotipy.Spotify, counting upstream calls."""
+
+    def __init__(self, track=None, playlist=None):
+        self._track = track
+        self._playlist = playlist
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def track(self, track_id):
+        with self._lock:
+            self.calls += 1
+        # Long enough for concurrent calls to overlap
+        time.sleep(0.1)
+        if isinstance(self._track, Exception):
+            raise self._track
+        return self._track
+
+    def playlist(self, playlist_id):
+        return self._playlist
+
+
+@pytest.fixture(scope='module')
+def mcp():
+    return server.create_server()
+
+
+@pytest.fixture
+def use_client(monkeypatch, request):
+    """Install a stub client for a client ID unique to the test."""
+    def install(client):
+        client_id = request.node.name
+        monkeypatch.setitem(server._CLIENTS, client_id, (client, float('inf')))
+        return SimpleNamespace(
+            session_config=SimpleNamespace(spotify_client_id=client_id)
+        )
+    return install
+
+
+def call(mcp, ctx, name, **arguments):
+    return mcp._tool_manager.get_tool(name).fn(ctx=ctx, **arguments)
+
+
+def test_identical_calls_are_coalesced(mcp, use_client):
+    client = StubClient(track={'id': '1', 'name': 'Song'})
+    ctx = use_client(client)
+
+    async def run():
+        return await asyncio.gather(
+            *(call(mcp, ctx, 'get_track', track_id='1') for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert client.calls == 1
+    assert len({result.text for result in results}) == 1
+    assert not server._INFLIGHT
+
+
+def test_failed_call_reaches_every_waiter(mcp, use_client):
+    client = StubClient(track=RuntimeError('upstream failed'))
+    ctx = use_client(client)
+
+    async def run():
+        return await asyncio.gather(
+            *(call(mcp, ctx, 'get_track', track_id='1') for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert client.calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not server._INFLIGHT
+
+
+def full_playlist(tracks: list) -> dict:
+    """Raw playlist object, keys in the order Spotify returns them."""
+    return {
+        'collaborative': False,
+        'description': '',
+        'id': 'p',
+        'images': [{'url': 'https://i.scdn.co/image/p', 'height': 640}],
+        'name': 'Big playlist',
+        'tracks': {'items': tracks, 'total': len(tracks)},
+    }
+
+
+def playlist_item(index: int, **extra) -> dict:
+    return {
+        'added_at': '2024-01-01T00:00:00Z',
+        'track': {
+            'available_markets': ['AD', 'AE', 'AG'] * 60,
+            'id': f't{index}',
+            'name': f'Track {index}',
+            **extra,
+        },
+    }
+
+
+def test_oversized_response_is_summarized(mcp, use_client):
+    tracks = [playlist_item(i) for i in range(5000)]
+    ctx = use_client(StubClient(playlist=full_playlist(tracks)))
+
+    result = asyncio.run(
+        call(mcp, ctx, 'get_playlist', playlist_id='p', full=True)
+    )
+    summary = json.loads(result.text)
+
+    assert len(result.text) <= server.MAX_RESPONSE_SIZE
+    assert summary['truncated'] is True
+    assert summary['size'] > server.MAX_RESPONSE_SIZE
+    assert summary['count'] == 5000
+    assert summary['first'] == tracks[0]
+
+
+def test_oversized_first_item_is_dropped(mcp, use_client):
+    padding = 'x' * server.MAX_RESPONSE_SIZE
+    tracks = [playlist_item(i, padding=padding) for i in range(2)]
+    ctx = use_client(StubClient(playlist=full_playlist(tracks)))
+
+    result = asyncio.run(
+        call(mcp, ctx, 'get_playlist', playlist_id='p', full=True)
+    )
+    summary = json.loads(result.text)
+
+    assert len(result.text) <= server.MAX_RESPONSE_SIZE
+    assert summary['count'] == 2
+    assert 'first' not in summary